@@ -1,14 +1,33 @@
+import importlib.util
+import json
 import math
+import os
 import pygame
 import random
+import statistics
+import threading
+import time
+from array import array
+from collections import deque
 from dataclasses import dataclass
-from typing import Dict, List, Tuple
+from typing import TYPE_CHECKING, Deque, Dict, Iterable, List, Optional, Set, Tuple, cast
+
+if TYPE_CHECKING:
+    import pandas
 
 
 # === CONFIGURACIÓN GLOBAL ===
 WINDOW_WIDTH = 800
 WINDOW_HEIGHT = 600
 FPS = 60
+FRAME_PACING = "sleep"
+FRAME_PACING_MODES = ("vsync", "busy", "sleep")
+MAX_FRAME_SKIP = 5
+FRAME_STEP_HYSTERESIS = 0.75
+FRAME_STATS_WINDOW = 120
+LOAD_SHEDDING = False
+LOAD_SHED_AFTER_FRAMES = 30
+LOAD_RESTORE_AFTER_FRAMES = 120
 PADDLE_WIDTH = 110
 PADDLE_HEIGHT = 20
 PADDLE_SPEED = 7
@@ -27,6 +46,19 @@ BRICK_HEIGHT = 25
 BRICK_PADDING = 6
 BRICK_TOP_OFFSET = 80
 INITIAL_LIVES = 3
+POWERUP_SIZE = 34
+LASER_WIDTH = 6
+LASER_HEIGHT = 20
+TELEMETRY_PATH: Optional[str] = None
+TELEMETRY_FORMAT = "jsonl"
+TELEMETRY_FORMATS = ("jsonl", "parquet")
+TELEMETRY_CAPACITY = 8192
+TELEMETRY_FLUSH_INTERVAL_S = 1.0
+SOUND_ENABLED = True
+SOUND_FREQUENCY = 22050
+SOUND_BUFFER = 256
+SOUND_CHANNELS = 8
+SOUND_VOLUME = 0.5
 
 
 Color = Tuple[int, int, int]
@@ -39,6 +71,11 @@ BLUE: Color = (66, 135, 245)
 YELLOW: Color = (240, 230, 90)
 ORANGE: Color = (255, 140, 0)
 PURPLE: Color = (180, 120, 255)
+SPRITE_COLORKEY: Color = (255, 0, 255)
+INDESTRUCTIBLE_BRICK_COLOR: Color = (90, 90, 120)
+
+# (tipo, color, explosivo, destructible, tamaño)
+SpriteKey = Tuple[str, Color, bool, bool, Tuple[int, int]]
 
 BRICK_PALETTE: List[Color] = [
     (255, 99, 71),
@@ -71,6 +108,40 @@ POWERUP_COLORS: Dict[str, Color] = {
     "1up": (120, 255, 120),
 }
 
+# (t, evento, nivel, x, y, tipo, valor)
+TelemetryEvent = Tuple[int, str, int, int, int, str, float]
+TELEMETRY_FIELDS = ("t", "event", "level", "x", "y", "kind", "value")
+# La sesión (una por ejecución) se añade al volcar para no tocar record(); t sigue
+# contando entre partidas, que se separan con los eventos game_started/game_over.
+TELEMETRY_COLUMNS = ("session",) + TELEMETRY_FIELDS
+TELEMETRY_EVENTS = (
+    "game_started",
+    "game_over",
+    "brick_destroyed",
+    "powerup_spawned",
+    "powerup_collected",
+    "ball_lost",
+    "life_lost",
+    "level_cleared",
+    "speed_up",
+)
+
+# nombre: (forma de onda, frecuencia inicial, frecuencia final, duración ms, prioridad)
+SOUND_EFFECTS: Dict[str, Tuple[str, float, float, int, int]] = {
+    "paddle": ("square", 440.0, 440.0, 60, 2),
+    "wall": ("square", 330.0, 330.0, 40, 0),
+    "brick": ("square", 660.0, 880.0, 70, 1),
+    "explosion": ("noise", 0.0, 0.0, 350, 3),
+    "laser": ("square", 1200.0, 500.0, 90, 1),
+    "powerup": ("sine", 520.0, 1040.0, 180, 2),
+    "ball_lost": ("sine", 400.0, 120.0, 400, 3),
+}
+
+# Cada tipo tiene un color propio, así el sprite se identifica por su color.
+POWERUP_LABELS: Dict[Color, str] = {
+    color: str.upper(kind[0]) for kind, color in POWERUP_COLORS.items()
+}
+
 POWERUP_DURATION_MS: Dict[str, int] = {
     "slow": 8000,
     "widen": 10000,
@@ -105,8 +176,8 @@ class Paddle:
         self.rect.x += direction * self.speed
         self.rect.x = int(clamp(self.rect.x, 0, WINDOW_WIDTH - self.rect.width))
 
-    def draw(self, surface: pygame.Surface) -> None:
-        pygame.draw.rect(surface, WHITE, self.rect, border_radius=6)
+    def sprite_key(self) -> SpriteKey:
+        return ("paddle", WHITE, False, True, self.rect.size)
 
 
 @dataclass
@@ -120,8 +191,8 @@ class Ball:
         self.rect.x += int(self.velocity.x)
         self.rect.y += int(self.velocity.y)
 
-    def draw(self, surface: pygame.Surface) -> None:
-        pygame.draw.ellipse(surface, WHITE, self.rect)
+    def sprite_key(self) -> SpriteKey:
+        return ("ball", WHITE, False, True, self.rect.size)
 
     def reset(self, position: Tuple[int, int]) -> None:
         self.rect.center = position
@@ -156,15 +227,8 @@ class Brick:
     destructible: bool = True
     explosive: bool = False
 
-    def draw(self, surface: pygame.Surface) -> None:
-        color = self.color
-        if not self.destructible:
-            color = (90, 90, 120)
-        pygame.draw.rect(surface, color, self.rect, border_radius=4)
-        pygame.draw.rect(surface, BLACK, self.rect, width=2, border_radius=4)
-        if self.explosive:
-            center = self.rect.center
-            pygame.draw.circle(surface, (255, 255, 255), center, self.rect.width // 6)
+    def sprite_key(self) -> SpriteKey:
+        return ("brick", self.color, self.explosive, self.destructible, self.rect.size)
 
 
 @dataclass
@@ -176,14 +240,9 @@ class PowerUp:
     def update(self) -> None:
         self.rect.y += self.speed
 
-    def draw(self, surface: pygame.Surface) -> None:
+    def sprite_key(self) -> SpriteKey:
         color = POWERUP_COLORS.get(self.kind, WHITE)
-        pygame.draw.rect(surface, color, self.rect, border_radius=6)
-        text = str.upper(self.kind[0])
-        font = pygame.font.SysFont("arial", 18, bold=True)
-        label = font.render(text, True, BLACK)
-        label_rect = label.get_rect(center=self.rect.center)
-        surface.blit(label, label_rect)
+        return ("powerup", color, False, True, self.rect.size)
 
 
 @dataclass
@@ -194,18 +253,394 @@ class LaserShot:
     def update(self) -> None:
         self.rect.y += self.speed
 
-    def draw(self, surface: pygame.Surface) -> None:
-        pygame.draw.rect(surface, WHITE, self.rect, border_radius=2)
+    def sprite_key(self) -> SpriteKey:
+        return ("laser", WHITE, False, True, self.rect.size)
 
 
-class ArkanoidGame:
+class SpriteAtlas:
     def __init__(self) -> None:
+        self.sprites: Dict[SpriteKey, pygame.Surface] = {}
+        self.label_font = pygame.font.SysFont("arial", 18, bold=True)
+
+    def clear(self) -> None:
+        self.sprites.clear()
+
+    def build(self, keys: Iterable[SpriteKey]) -> None:
+        for key in keys:
+            self.get(key)
+
+    def get(self, key: SpriteKey) -> pygame.Surface:
+        sprite = self.sprites.get(key)
+        if sprite is None:
+            sprite = self.render(key)
+            self.sprites[key] = sprite
+        return sprite
+
+    def render(self, key: SpriteKey) -> pygame.Surface:
+        kind, color, explosive, destructible, size = key
+        surface = pygame.Surface(size)
+        surface.fill(SPRITE_COLORKEY)
+        rect = surface.get_rect()
+        if kind == "brick":
+            if not destructible:
+                color = INDESTRUCTIBLE_BRICK_COLOR
+            pygame.draw.rect(surface, color, rect, border_radius=4)
+            pygame.draw.rect(surface, BLACK, rect, width=2, border_radius=4)
+            if explosive:
+                pygame.draw.circle(surface, WHITE, rect.center, rect.width // 6)
+        elif kind == "paddle":
+            pygame.draw.rect(surface, color, rect, border_radius=6)
+        elif kind == "ball":
+            pygame.draw.ellipse(surface, color, rect)
+        elif kind == "laser":
+            pygame.draw.rect(surface, color, rect, border_radius=2)
+        elif kind == "powerup":
+            pygame.draw.rect(surface, color, rect, border_radius=6)
+            text = POWERUP_LABELS.get(color, "")
+            label = self.label_font.render(text, True, BLACK)
+            surface.blit(label, label.get_rect(center=rect.center))
+        surface = surface.convert()
+        surface.set_colorkey(SPRITE_COLORKEY, pygame.RLEACCEL)
+        return surface
+
+
+@dataclass
+class FrameStats:
+    frames: int
+    simulated_steps: int
+    skipped_renders: int
+    mean_frame_ms: float
+    jitter_ms: float
+    max_frame_ms: float
+    reduced_quality: bool
+
+
+class FramePacer:
+    def __init__(
+        self,
+        clock: pygame.time.Clock,
+        mode: str = FRAME_PACING,
+        fps: int = FPS,
+        load_shedding: bool = LOAD_SHEDDING,
+    ) -> None:
+        if mode not in FRAME_PACING_MODES:
+            raise ValueError(f"Modo de sincronización desconocido: {mode}")
+        self.clock = clock
+        self.mode = mode
+        self.fps = fps
+        # tick(fps) espera milisegundos enteros (16 ms a 60 FPS): el paso de la
+        # simulación usa esa misma duración para que ambos relojes coincidan.
+        self.step_ms = float(1000 // fps)
+        self.load_shedding = load_shedding
+        self.accumulator = 0.0
+        self.frame_times: Deque[float] = deque(maxlen=FRAME_STATS_WINDOW)
+        self.frames = 0
+        self.simulated_steps = 0
+        self.skipped_renders = 0
+        self.over_budget_frames = 0
+        self.under_budget_frames = 0
+        self.last_frame = 0.0
+        self.work_started = 0.0
+        self.reduced_quality = False
+
+    def start(self) -> None:
+        self.clock.tick()
+        self.last_frame = time.perf_counter()
+        self.accumulator = 0.0
+
+    def wait(self) -> int:
+        # Con vsync, flip() ya bloquea hasta el refresco; tick(fps) solo limita
+        # cuando el controlador ignora la petición.
+        if self.mode == "busy":
+            self.clock.tick_busy_loop(self.fps)
+        else:
+            self.clock.tick(self.fps)
+        now = time.perf_counter()
+        elapsed = (now - self.last_frame) * 1000
+        self.last_frame = now
+        self.frames += 1
+        self.frame_times.append(elapsed)
+        self.accumulator = min(self.accumulator + elapsed, self.step_ms * MAX_FRAME_SKIP)
+        # Un paso por fotograma mientras el resto no pase de ±0,75 pasos; al
+        # corregir, el resto queda lejos del umbral contrario y la fluctuación de
+        # tick() no alterna fotogramas de 0 y 2 pasos. El tiempo real nunca se pierde.
+        steps = 1
+        if abs(self.accumulator - self.step_ms) > self.step_ms * FRAME_STEP_HYSTERESIS:
+            steps = max(0, round(self.accumulator / self.step_ms))
+        self.accumulator -= steps * self.step_ms
+        self.simulated_steps += steps
+        self.skipped_renders += max(0, steps - 1)
+        self.work_started = time.perf_counter()
+        return steps
+
+    def end_work(self) -> None:
+        # Se llama antes de flip(): con vsync, flip() espera al refresco y esa
+        # espera no es carga del juego.
+        if self.load_shedding:
+            self.shed_load((time.perf_counter() - self.work_started) * 1000)
+
+    def shed_load(self, work_ms: float) -> None:
+        if work_ms > self.step_ms:
+            self.over_budget_frames += 1
+        else:
+            self.over_budget_frames = 0
+        if work_ms < self.step_ms / 2:
+            self.under_budget_frames += 1
+        else:
+            self.under_budget_frames = 0
+        if self.over_budget_frames >= LOAD_SHED_AFTER_FRAMES:
+            self.reduced_quality = True
+            self.over_budget_frames = 0
+        elif self.under_budget_frames >= LOAD_RESTORE_AFTER_FRAMES:
+            self.reduced_quality = False
+            self.under_budget_frames = 0
+
+    def stats(self) -> FrameStats:
+        times = list(self.frame_times)
+        return FrameStats(
+            frames=self.frames,
+            simulated_steps=self.simulated_steps,
+            skipped_renders=self.skipped_renders,
+            mean_frame_ms=statistics.fmean(times) if times else 0.0,
+            jitter_ms=statistics.pstdev(times) if len(times) > 1 else 0.0,
+            max_frame_ms=max(times, default=0.0),
+            reduced_quality=self.reduced_quality,
+        )
+
+
+class Telemetry:
+    def __init__(
+        self,
+        path: Optional[str] = TELEMETRY_PATH,
+        fmt: str = TELEMETRY_FORMAT,
+        capacity: int = TELEMETRY_CAPACITY,
+        flush_interval: float = TELEMETRY_FLUSH_INTERVAL_S,
+    ) -> None:
+        if fmt not in TELEMETRY_FORMATS:
+            raise ValueError(f"Formato de telemetría desconocido: {fmt}")
+        self.path = path
+        self.fmt = fmt
+        self.capacity = capacity
+        self.flush_interval = flush_interval
+        self.enabled = path is not None
+        # Búfer circular: el juego solo avanza head y el hilo de volcado solo tail.
+        self.buffer: List[Optional[TelemetryEvent]] = [None] * capacity
+        self.head = 0
+        self.tail = 0
+        self.dropped = 0
+        self.batches = 0
+        self.errors = 0
+        self.last_error: Optional[Exception] = None
+        self.session = int(time.time() * 1000)
+        self.stop_event = threading.Event()
+        self.thread: Optional[threading.Thread] = None
+        if self.enabled:
+            self.prepare_output()
+            self.thread = threading.Thread(
+                target=self.flush_loop, name="telemetry", daemon=True
+            )
+            self.thread.start()
+
+    def record(
+        self,
+        event: str,
+        level: int,
+        x: int = 0,
+        y: int = 0,
+        kind: str = "",
+        value: float = 0.0,
+    ) -> None:
+        if not self.enabled:
+            return
+        head = self.head
+        if head - self.tail >= self.capacity:
+            self.dropped += 1
+            return
+        self.buffer[head % self.capacity] = (
+            pygame.time.get_ticks(), event, level, x, y, kind, value
+        )
+        self.head = head + 1
+
+    def prepare_output(self) -> None:
+        assert self.path is not None
+        if self.fmt == "parquet":
+            if importlib.util.find_spec("pandas") is None:
+                raise ImportError("La telemetría en Parquet necesita pandas")
+            if not any(importlib.util.find_spec(name) for name in ("pyarrow", "fastparquet")):
+                raise ImportError("La telemetría en Parquet necesita pyarrow o fastparquet")
+            os.makedirs(self.path, exist_ok=True)
+            return
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+    def drain(self) -> Tuple[int, List[TelemetryEvent]]:
+        # tail solo avanza cuando el lote se ha escrito; un fallo lo reintenta.
+        head = self.head
+        batch = [self.buffer[i % self.capacity] for i in range(self.tail, head)]
+        return head, cast(List[TelemetryEvent], batch)
+
+    def flush_loop(self) -> None:
+        while not self.stop_event.wait(self.flush_interval):
+            self.flush()
+        self.flush()
+
+    def flush(self) -> None:
+        head, batch = self.drain()
+        if not batch or self.path is None:
+            return
+        try:
+            self.write(self.path, batch)
+        except Exception as error:
+            self.errors += 1
+            self.last_error = error
+            return
+        self.tail = head
+        self.batches += 1
+
+    def write(self, path: str, batch: List[TelemetryEvent]) -> None:
+        rows = [(self.session, *event) for event in batch]
+        if self.fmt == "jsonl":
+            # Una sola escritura por lote: un reintento no duplica filas ya añadidas
+            # (salvo una escritura corta del sistema, p. ej. con el disco lleno).
+            payload = "".join(
+                json.dumps(dict(zip(TELEMETRY_COLUMNS, row))) + "\n" for row in rows
+            )
+            with open(path, "a", encoding="utf-8") as stream:
+                stream.write(payload)
+        else:
+            import pandas as pd
+
+            part = os.path.join(path, f"part-{self.session}-{self.batches:06d}.parquet")
+            pd.DataFrame(rows, columns=list(TELEMETRY_COLUMNS)).to_parquet(part, index=False)
+
+    def close(self) -> None:
+        if self.thread is None:
+            return
+        self.stop_event.set()
+        self.thread.join()
+        self.thread = None
+
+
+def load_telemetry(path: str) -> "pandas.DataFrame":
+    import pandas as pd
+
+    if os.path.isdir(path):
+        return pd.read_parquet(path)
+    return pd.read_json(path, lines=True)
+
+
+class SoundBank:
+    def __init__(
+        self, enabled: bool = SOUND_ENABLED, num_channels: int = SOUND_CHANNELS
+    ) -> None:
+        self.sounds: Dict[str, pygame.mixer.Sound] = {}
+        self.channels: List[pygame.mixer.Channel] = []
+        self.channel_priority: List[int] = []
+        self.channel_started: List[int] = []
+        self.pending: Set[str] = set()
+        self.stolen = 0
+        self.dropped = 0
+        self.enabled = enabled and self.init_mixer()
+        if not self.enabled:
+            return
+        pygame.mixer.set_num_channels(num_channels)
+        pygame.mixer.set_reserved(num_channels)
+        self.channels = [pygame.mixer.Channel(i) for i in range(num_channels)]
+        self.channel_priority = [0] * num_channels
+        self.channel_started = [0] * num_channels
+        for name in SOUND_EFFECTS:
+            self.sounds[name] = self.synthesize(name)
+
+    def init_mixer(self) -> bool:
+        if pygame.mixer.get_init() is None:
+            try:
+                pygame.mixer.init(SOUND_FREQUENCY, -16, 1, SOUND_BUFFER)
+            except pygame.error:
+                return False
+        return True
+
+    def synthesize(self, name: str) -> pygame.mixer.Sound:
+        waveform, start_freq, end_freq, duration_ms, _ = SOUND_EFFECTS[name]
+        frequency, _, output_channels = pygame.mixer.get_init()
+        total = frequency * duration_ms // 1000
+        rng = random.Random(name)
+        samples = array("h")
+        phase = 0.0
+        for i in range(total):
+            progress = i / total
+            phase += (start_freq + (end_freq - start_freq) * progress) / frequency
+            if waveform == "noise":
+                value = rng.uniform(-1.0, 1.0)
+            elif waveform == "square":
+                value = 1.0 if phase % 1.0 < 0.5 else -1.0
+            else:
+                value = math.sin(2 * math.pi * phase)
+            sample = int(value * (1.0 - progress) * 32767 * SOUND_VOLUME)
+            samples.extend([sample] * output_channels)
+        return pygame.mixer.Sound(buffer=samples.tobytes())
+
+    def play(self, name: str) -> None:
+        # Las ráfagas del mismo efecto dentro de un fotograma se reproducen una vez.
+        if self.enabled:
+            self.pending.add(name)
+
+    def flush(self) -> None:
+        if not self.pending:
+            return
+        now = pygame.time.get_ticks()
+        by_priority = sorted(
+            self.pending, key=lambda name: SOUND_EFFECTS[name][4], reverse=True
+        )
+        self.pending.clear()
+        for name in by_priority:
+            priority = SOUND_EFFECTS[name][4]
+            index = self.pick_channel(priority)
+            if index is None:
+                self.dropped += 1
+                continue
+            self.channels[index].play(self.sounds[name])
+            self.channel_priority[index] = priority
+            self.channel_started[index] = now
+
+    def pick_channel(self, priority: int) -> Optional[int]:
+        candidates = []
+        for index, channel in enumerate(self.channels):
+            if not channel.get_busy():
+                return index
+            if self.channel_priority[index] <= priority:
+                candidates.append(index)
+        if not candidates:
+            return None
+        self.stolen += 1
+        return min(
+            candidates, key=lambda i: (self.channel_priority[i], self.channel_started[i])
+        )
+
+
+class ArkanoidGame:
+    def __init__(
+        self,
+        pacing_mode: str = FRAME_PACING,
+        load_shedding: bool = LOAD_SHEDDING,
+        telemetry_path: Optional[str] = TELEMETRY_PATH,
+        sound_enabled: bool = SOUND_ENABLED,
+    ) -> None:
+        if sound_enabled:
+            pygame.mixer.pre_init(SOUND_FREQUENCY, -16, 1, SOUND_BUFFER)
         pygame.init()
-        self.screen = pygame.display.set_mode((WINDOW_WIDTH, WINDOW_HEIGHT))
-        pygame.display.set_caption("Arkanoid - Python Edition")
+        if not sound_enabled:
+            # pygame.init() también abre el mezclador; sin sonido no se usa.
+            pygame.mixer.quit()
+        self.telemetry = Telemetry(telemetry_path)
+        self.sounds = SoundBank(sound_enabled)
         self.clock = pygame.time.Clock()
+        self.pacer = FramePacer(self.clock, pacing_mode, FPS, load_shedding)
+        self.screen = self.create_screen(pacing_mode)
+        pygame.display.set_caption("Arkanoid - Python Edition")
         self.font = pygame.font.SysFont("arial", 24)
         self.big_font = pygame.font.SysFont("arial", 56, bold=True)
+        self.atlas = SpriteAtlas()
 
         paddle_rect = pygame.Rect(
             (WINDOW_WIDTH - PADDLE_WIDTH) // 2,
@@ -237,6 +672,16 @@ class ArkanoidGame:
 
         self.create_level()
         self.reset_balls()
+        self.telemetry.record("game_started", self.level)
+
+    def create_screen(self, pacing_mode: str) -> pygame.Surface:
+        size = (WINDOW_WIDTH, WINDOW_HEIGHT)
+        if pacing_mode == "vsync":
+            try:
+                return pygame.display.set_mode(size, pygame.SCALED, vsync=1)
+            except pygame.error:
+                pass
+        return pygame.display.set_mode(size)
 
     # === CREACIÓN DE NIVELES Y ENTORNO ===
     def create_level(self) -> None:
@@ -277,8 +722,20 @@ class ArkanoidGame:
 
                 self.bricks.append(Brick(rect, color, int(hit_points), destructible, explosive))
 
+        self.build_sprite_atlas()
         self.apply_level_scaling()
 
+    def build_sprite_atlas(self) -> None:
+        self.atlas.clear()
+        self.atlas.build(brick.sprite_key() for brick in self.bricks)
+        self.atlas.build(
+            PowerUp(pygame.Rect(0, 0, POWERUP_SIZE, POWERUP_SIZE), kind).sprite_key()
+            for kind in POWERUP_TYPES
+        )
+        ball_rect = pygame.Rect(0, 0, BALL_SIZE, BALL_SIZE)
+        self.atlas.get(Ball(ball_rect, pygame.Vector2()).sprite_key())
+        self.atlas.get(LaserShot(pygame.Rect(0, 0, LASER_WIDTH, LASER_HEIGHT)).sprite_key())
+
     def should_place_brick(self, pattern_type: int, row: int, col: int) -> bool:
         if pattern_type == 0:
             return True
@@ -321,6 +778,7 @@ class ArkanoidGame:
     def apply_paddle_width(self) -> None:
         width = self.paddle_base_width * self.paddle_width_modifier
         self.update_paddle_width(width)
+        self.atlas.get(self.paddle.sprite_key())
 
     def current_ball_speed(self) -> float:
         return self.ball_speed * self.ball_speed_modifier
@@ -344,13 +802,21 @@ class ArkanoidGame:
 
     # === BUCLE PRINCIPAL DEL JUEGO ===
     def run(self) -> None:
-        while self.running:
-            self.clock.tick(FPS)
-            self.handle_events()
-            if not self.game_over:
-                self.update_game()
-            self.draw()
-        pygame.quit()
+        self.pacer.start()
+        try:
+            while self.running:
+                steps = self.pacer.wait()
+                self.handle_events()
+                for _ in range(steps):
+                    if self.game_over:
+                        break
+                    self.update_game()
+                self.sounds.flush()
+                self.draw()
+        finally:
+            # Los últimos eventos son justo los que explican un cierre inesperado.
+            self.telemetry.close()
+            pygame.quit()
 
     def handle_events(self) -> None:
         for event in pygame.event.get():
@@ -385,6 +851,7 @@ class ArkanoidGame:
         self.update_lasers(keys)
 
         if not self.bricks:
+            self.telemetry.record("level_cleared", self.level, value=self.score)
             self.level += 1
             self.create_level()
             self.apply_paddle_width()
@@ -401,13 +868,16 @@ class ArkanoidGame:
         if ball.rect.left <= 0:
             ball.rect.left = 0
             ball.velocity.x = abs(ball.velocity.x)
+            self.sounds.play("wall")
         elif ball.rect.right >= WINDOW_WIDTH:
             ball.rect.right = WINDOW_WIDTH
             ball.velocity.x = -abs(ball.velocity.x)
+            self.sounds.play("wall")
 
         if ball.rect.top <= 0:
             ball.rect.top = 0
             ball.velocity.y = abs(ball.velocity.y)
+            self.sounds.play("wall")
         if ball.rect.top > WINDOW_HEIGHT:
             self.remove_ball(ball)
             return
@@ -420,6 +890,7 @@ class ArkanoidGame:
             direction = pygame.Vector2(offset, -1).normalize()
             ball.velocity = direction * self.current_ball_speed()
             ball.rect.bottom = self.paddle.rect.top - 1
+            self.sounds.play("paddle")
             if self.sticky_enabled:
                 ball.attach_to_paddle(self.paddle)
                 ball.follow_paddle(self.paddle)
@@ -463,6 +934,8 @@ class ArkanoidGame:
         if brick not in self.bricks:
             return
         self.bricks.remove(brick)
+        self.telemetry.record("brick_destroyed", self.level, *brick.rect.center)
+        self.sounds.play("brick")
         self.score += 10 * self.level
         self.bricks_destroyed += 1
         if brick.explosive:
@@ -474,8 +947,10 @@ class ArkanoidGame:
     def increase_ball_speed(self, amount: float) -> None:
         self.ball_speed += amount
         self.refresh_ball_speeds()
+        self.telemetry.record("speed_up", self.level, value=self.ball_speed)
 
     def trigger_explosion(self, brick: Brick) -> None:
+        self.sounds.play("explosion")
         radius = BRICK_WIDTH * 1.5
         center = pygame.Vector2(brick.rect.center)
         for other in list(self.bricks):
@@ -492,10 +967,10 @@ class ArkanoidGame:
         if random.random() > drop_chance:
             return
         kind = random.choice(POWERUP_TYPES)
-        size = 34
-        rect = pygame.Rect(0, 0, size, size)
+        rect = pygame.Rect(0, 0, POWERUP_SIZE, POWERUP_SIZE)
         rect.center = brick.rect.center
         self.powerups.append(PowerUp(rect, kind))
+        self.telemetry.record("powerup_spawned", self.level, *rect.center, kind=kind)
 
     def update_powerups(self) -> None:
         for powerup in list(self.powerups):
@@ -505,6 +980,10 @@ class ArkanoidGame:
                 continue
             if powerup.rect.colliderect(self.paddle.rect):
                 self.powerups.remove(powerup)
+                self.telemetry.record(
+                    "powerup_collected", self.level, *powerup.rect.center, kind=powerup.kind
+                )
+                self.sounds.play("powerup")
                 self.apply_powerup(powerup.kind)
 
     def update_lasers(self, keys: pygame.key.ScancodeWrapper) -> None:
@@ -529,10 +1008,11 @@ class ArkanoidGame:
                     break
 
     def spawn_laser_shots(self) -> None:
-        left_rect = pygame.Rect(0, 0, 6, 20)
-        right_rect = pygame.Rect(0, 0, 6, 20)
+        left_rect = pygame.Rect(0, 0, LASER_WIDTH, LASER_HEIGHT)
+        right_rect = pygame.Rect(0, 0, LASER_WIDTH, LASER_HEIGHT)
         left_rect.midbottom = (self.paddle.rect.left + 10, self.paddle.rect.top)
         right_rect.midbottom = (self.paddle.rect.right - 10, self.paddle.rect.top)
+        self.sounds.play("laser")
         self.laser_shots.append(LaserShot(left_rect))
         self.laser_shots.append(LaserShot(right_rect))
 
@@ -620,13 +1100,17 @@ class ArkanoidGame:
     def remove_ball(self, ball: Ball) -> None:
         if ball in self.balls:
             self.balls.remove(ball)
+            self.telemetry.record("ball_lost", self.level, ball.rect.centerx, WINDOW_HEIGHT)
         if not self.balls:
             self.lose_life()
 
     def lose_life(self) -> None:
         self.lives -= 1
+        self.telemetry.record("life_lost", self.level, value=self.lives)
+        self.sounds.play("ball_lost")
         if self.lives <= 0:
             self.game_over = True
+            self.telemetry.record("game_over", self.level, value=self.score)
             self.balls.clear()
             return
         self.reset_balls()
@@ -635,19 +1119,22 @@ class ArkanoidGame:
     # === REPRESENTACIÓN VISUAL ===
     def draw(self) -> None:
         self.screen.fill(GREY)
-        self.draw_background_grid()
-        for brick in self.bricks:
-            brick.draw(self.screen)
-        for powerup in self.powerups:
-            powerup.draw(self.screen)
-        for shot in self.laser_shots:
-            shot.draw(self.screen)
-        self.paddle.draw(self.screen)
-        for ball in self.balls:
-            ball.draw(self.screen)
+        if not self.pacer.reduced_quality:
+            self.draw_background_grid()
+        self.screen.blits(self.sprite_batch(), doreturn=False)
         self.draw_ui()
+        self.pacer.end_work()
         pygame.display.flip()
 
+    def sprite_batch(self) -> List[Tuple[pygame.Surface, pygame.Rect]]:
+        get = self.atlas.get
+        batch = [(get(brick.sprite_key()), brick.rect) for brick in self.bricks]
+        batch.extend((get(powerup.sprite_key()), powerup.rect) for powerup in self.powerups)
+        batch.extend((get(shot.sprite_key()), shot.rect) for shot in self.laser_shots)
+        batch.append((get(self.paddle.sprite_key()), self.paddle.rect))
+        batch.extend((get(ball.sprite_key()), ball.rect) for ball in self.balls)
+        return batch
+
     def draw_ui(self) -> None:
         score_surface = self.font.render(f"Puntaje: {self.score}", True, WHITE)
         lives_surface = self.font.render(f"Vidas: {self.lives}", True, WHITE)
@@ -713,6 +1200,7 @@ class ArkanoidGame:
         self.create_level()
         self.paddle.rect.centerx = WINDOW_WIDTH // 2
         self.reset_balls()
+        self.telemetry.record("game_started", self.level)
 
     def draw_background_grid(self) -> None:
         grid_color = (60, 60, 60)